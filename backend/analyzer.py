@@ -4,27 +4,240 @@
     - Utilise UN SEUL endpoint: https://api.etherscan.io/v2/api
     - Passe la chaîne via ?chainid=1|56|137 (Ethereum/BSC/Polygon)
     - Suivi des proxys (Proxy/Implementation) + flag proxy_pattern
+    - HTTP asynchrone (httpx, HTTP/2) avec pool de connexions partagé :
+      le fetch Etherscan ne bloque plus l'event loop FastAPI et les appels
+      successifs (dont le suivi de proxy) multiplexent la même connexion TLS
     - Parsing robuste: result peut être list/dict; fallback si message contient
       du code
 """
 
 from __future__ import annotations
+import asyncio
+import concurrent.futures
+import hashlib
 import os
-import re
+import random
+import time
 from typing import Dict, Tuple, Optional
 
-import requests
+import httpx
+import orjson
+
+# Optional: cache Redis partagé entre workers (activé si REDIS_URL est défini)
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except Exception:
+    aioredis = None
 
 from . import rules
 from . import report
 
 HDP_DEBUG = os.getenv("HDP_DEBUG") == "1"
 
+# Caractères hexadécimaux valides pour une adresse EVM
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+
+# Taille max (caractères) de source passée aux règles — les sources aplaties
+# (imports OpenZeppelin inlinés) peuvent atteindre plusieurs MB alors que les
+# heuristiques sont purement lexicales (0 = pas de troncature)
+HDP_MAX_SOURCE_BYTES = int(os.getenv("HDP_MAX_SOURCE_BYTES", "524288"))
+
+# TTL (secondes) du cache mémoire des sources vérifiées (0 = désactivé)
+HDP_CACHE_TTL = int(os.getenv("HDP_CACHE_TTL", "3600"))
+_SOURCE_CACHE_MAX = 10_000
+
+
+class _TTLCache:
+    """Petit cache TTL en mémoire (dict + timestamps, éviction du plus ancien)."""
+
+    def __init__(self, maxsize: int, ttl: int) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[object, Tuple[float, object]] = {}
+
+    def get(self, key: object) -> Optional[object]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        ts, value = item
+        if time.monotonic() - ts > self.ttl:
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: object, value: object) -> None:
+        if len(self._data) >= self.maxsize:
+            # éviction FIFO : les dicts CPython gardent l'ordre d'insertion
+            self._data.pop(next(iter(self._data)), None)
+        self._data[key] = (time.monotonic(), value)
+
+
+# Cache partagé par tous les analyzers du process, clé = (chain_id, address)
+_source_cache = _TTLCache(maxsize=_SOURCE_CACHE_MAX, ttl=HDP_CACHE_TTL)
+
+# Deuxième niveau : flags calculés, clé = hash de la source. Les règles sont
+# des fonctions pures du texte → valide tant que RULES_VERSION ne bouge pas.
+_flags_cache = _TTLCache(maxsize=_SOURCE_CACHE_MAX, ttl=HDP_CACHE_TTL)
+
+
+# Workers pour déporter run_all_checks (CPU-bound sur grosses sources) hors
+# du GIL lors de gros batchs; 0 = exécution inline (défaut, évite l'IPC)
+HDP_RULES_WORKERS = int(os.getenv("HDP_RULES_WORKERS", "0"))
+_rules_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_rules_executor() -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    global _rules_executor
+    if HDP_RULES_WORKERS <= 0:
+        return None
+    if _rules_executor is None:
+        # `rules` s'importe vite (l'automate se reconstruit une fois par worker)
+        _rules_executor = concurrent.futures.ProcessPoolExecutor(max_workers=HDP_RULES_WORKERS)
+    return _rules_executor
+
+
+async def _run_rules(source_code: str, source_available: bool) -> Dict[str, bool]:
+    executor = _get_rules_executor()
+    if executor is None:
+        return rules.run_all_checks(source_code, source_available)
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, rules.run_all_checks, source_code, source_available
+    )
+
+
+def _flags_cache_key(source_code: str, source_available: bool) -> str:
+    src_hash = hashlib.blake2b(source_code.encode("utf-8", "ignore"), digest_size=16).hexdigest()
+    return f"hdp:flags:{rules.RULES_VERSION}:{int(source_available)}:{src_hash}"
+
+# ------------------------------------------------------------
+# Rate limiting côté client + retries (Etherscan free tier: 5 req/s)
+# ------------------------------------------------------------
+HDP_RPS = float(os.getenv("HDP_RPS", "5"))
+_MAX_RETRIES = 6
+
+# Nombre max d'analyses simultanées lors d'un batch (analyze_many)
+HDP_MAX_INFLIGHT = int(os.getenv("HDP_MAX_INFLIGHT", "16"))
+
+
+class _RateLimiter:
+    """Espacement minimal entre requêtes (token bucket simplifié, async-safe)."""
+
+    def __init__(self, max_rate: float) -> None:
+        self.interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Un limiteur par chaîne (les quotas Etherscan v2 sont par clé/chaîne)
+_rate_limiters: Dict[str, _RateLimiter] = {}
+
+
+def _get_rate_limiter(chain_id: str) -> _RateLimiter:
+    limiter = _rate_limiters.get(chain_id)
+    if limiter is None:
+        limiter = _rate_limiters[chain_id] = _RateLimiter(HDP_RPS)
+    return limiter
+
+
+def _is_rate_limited(data: dict) -> bool:
+    """Réponse JSON status=0 dont le message indique un dépassement de quota."""
+    if str(data.get("status", "1")) == "1":
+        return False
+    msg = data.get("result") if isinstance(data.get("result"), str) else data.get("message", "")
+    return isinstance(msg, str) and "rate limit" in msg.lower()
+
+
+# ------------------------------------------------------------
+# Cache Redis partagé entre workers uvicorn (optionnel)
+# ------------------------------------------------------------
+# La source vérifiée d'une adresse est quasi immuable → TTL long; les proxys
+# peuvent changer d'implémentation → TTL court.
+REDIS_URL = os.getenv("REDIS_URL", "")
+_REDIS_TTL = int(os.getenv("HDP_REDIS_TTL", "86400"))
+_REDIS_TTL_PROXY = int(os.getenv("HDP_REDIS_TTL_PROXY", "300"))
+
+_redis = None
+_redis_ok = True  # passe à False au premier échec pour dégrader en mémoire
+
+
+def _get_redis():
+    global _redis
+    if not (REDIS_URL and aioredis and _redis_ok):
+        return None
+    if _redis is None:
+        _redis = aioredis.from_url(REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def _redis_get(key: str) -> Optional[dict]:
+    global _redis_ok
+    r = _get_redis()
+    if r is None:
+        return None
+    try:
+        raw = await r.get(key)
+        return orjson.loads(raw) if raw else None
+    except Exception as e:
+        if HDP_DEBUG:
+            print(f"[HDP] Redis GET failed ({e}); falling back to memory cache")
+        _redis_ok = False
+        return None
+
+
+async def _redis_set(key: str, value: dict, ttl: int) -> None:
+    global _redis_ok
+    r = _get_redis()
+    if r is None:
+        return
+    try:
+        await r.set(key, orjson.dumps(value), ex=ttl)
+    except Exception as e:
+        if HDP_DEBUG:
+            print(f"[HDP] Redis SET failed ({e}); falling back to memory cache")
+        _redis_ok = False
+
+
+# ------------------------------------------------------------
+# Client httpx partagé (pool de connexions, HTTP/2 + keep-alive)
+# ------------------------------------------------------------
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_session() -> httpx.AsyncClient:
+    """Retourne le client partagé (créé paresseusement sur l'event loop)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=15,
+        )
+    return _client
+
+
+async def close_session() -> None:
+    """Ferme le client partagé (à appeler au shutdown / fin de CLI)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
 
 class ContractAnalyzer:
     """
     Fetch & analyze contract source code from Etherscan API v2.
     A single Etherscan V2 API key can cover multiple chains by passing `chainid`.
+    All network methods are coroutines sharing one pooled httpx client.
     """
 
     # Chaînes supportées → chainid
@@ -36,6 +249,9 @@ class ContractAnalyzer:
 
     ETHERSCAN_V2_BASE = "https://api.etherscan.io/v2/api"
 
+    # Slot de stockage EIP-1967 de l'adresse d'implémentation d'un proxy
+    EIP1967_IMPL_SLOT = "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
+
     def __init__(self, api_key: Optional[str] = None, chain: str = "ethereum") -> None:
         chain = (chain or "ethereum").lower()
         if chain not in self.CHAIN_IDS:
@@ -54,26 +270,51 @@ class ContractAnalyzer:
         self.api_key = api_key or os.getenv(env_key_name) or os.getenv("ETHERSCAN_API_KEY", "")
         self.api_base = self.ETHERSCAN_V2_BASE
 
-        # flag interne pour marquer un proxy (si on a dû suivre Implementation)
-        self._last_proxy = False
-
     # ------------------------ utils internes ------------------------
 
     def _validate_address(self, address: str) -> None:
-        if not re.fullmatch(r"0x[a-fA-F0-9]{40}", address):
+        # Équivalent de fullmatch(r"0x[a-fA-F0-9]{40}") sans moteur regex.
+        # (int(x, 16) accepterait signes/underscores, d'où le test ensembliste.)
+        if len(address) != 42 or address[:2] != "0x" or not _HEX_CHARS.issuperset(address[2:]):
             raise ValueError(f"Invalid contract address: {address}")
 
-    def _http_get(self, params: Dict[str, str]) -> Optional[dict]:
+    async def _http_get(self, params: Dict[str, str]) -> Optional[dict]:
+        """GET avec rate limiting client + backoff exponentiel (jitter) sur 429.
+
+        Sans retry, un `429 Max calls per sec` transitoire renvoyait "" et le
+        contrat était faussement marqué `unverified_code`.
+        """
         if HDP_DEBUG:
             print(f"[HDP] GET {self.api_base} params={params}")
-        try:
-            r = requests.get(self.api_base, params=params, timeout=15)
-            r.raise_for_status()
-            return r.json()
-        except Exception as e:
+        limiter = _get_rate_limiter(self.chain_id)
+        for attempt in range(_MAX_RETRIES):
+            await limiter.acquire()
+            try:
+                client = await get_session()
+                r = await client.get(self.api_base, params=params)
+                r.raise_for_status()
+                data = orjson.loads(r.content)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 429 or attempt == _MAX_RETRIES - 1:
+                    if HDP_DEBUG:
+                        print(f"[HDP] HTTP error: {e}")
+                    return None
+                data = None  # retryable
+            except Exception as e:
+                if HDP_DEBUG:
+                    print(f"[HDP] HTTP error: {e}")
+                return None
+
+            if data is not None and not _is_rate_limited(data):
+                return data
+            if attempt == _MAX_RETRIES - 1:
+                break
+            # Backoff exponentiel borné, avec jitter pour désynchroniser les clients
+            delay = min(0.1 * 2 ** attempt, 8.0) * (0.5 + random.random())
             if HDP_DEBUG:
-                print(f"[HDP] HTTP error: {e}")
-            return None
+                print(f"[HDP] rate limited, retry {attempt + 1} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        return None
 
     def _extract_entry_and_source(self, data: dict) -> Tuple[Optional[dict], str]:
         """
@@ -108,7 +349,10 @@ class ContractAnalyzer:
 
         return entry, source
 
-    def _fetch_source_v2(self, address: str) -> Tuple[str, bool]:
+    async def _fetch_source_v2(self, address: str) -> Tuple[str, bool, bool]:
+        """Retourne (source, ok, proxy_followed) — pas d'état mutable partagé,
+        sans quoi des requêtes concurrentes sur le même analyzer se marchent
+        dessus."""
         params = {
             "module": "contract",
             "action": "getsourcecode",
@@ -116,9 +360,9 @@ class ContractAnalyzer:
             "chainid": self.chain_id,   # ← INDISPENSABLE en v2
             "apikey": self.api_key,     # ← clé v2 (multi-chaîne possible)
         }
-        data = self._http_get(params)
+        data = await self._http_get(params)
         if not data:
-            return "", False
+            return "", False, False
 
         # Cas clés invalides, quotas, etc.
         if str(data.get("status", "0")) != "1":
@@ -128,7 +372,7 @@ class ContractAnalyzer:
                 raise ValueError(f"Invalid API key for chain {self.chain}: {msg}")
             if HDP_DEBUG:
                 print(f"[HDP] Non-OK response: {data}")
-            return "", False
+            return "", False, False
 
         entry, source = self._extract_entry_and_source(data)
 
@@ -138,27 +382,133 @@ class ContractAnalyzer:
         ):
             impl = entry.get("Implementation") or entry.get("Implementation Address")
             if impl and isinstance(impl, str) and impl.lower().startswith("0x"):
-                self._last_proxy = True
                 if HDP_DEBUG:
                     print(f"[HDP] Following implementation {impl}")
-                impl_source, impl_ok = self._fetch_source_v2(impl)
-                return impl_source, impl_ok
+                impl_source, impl_ok, _ = await self._fetch_source_v2(impl)
+                return impl_source, impl_ok, True
 
-        return source, bool(source)
+        return source, bool(source), False
 
     # -------------------------- API publique --------------------------
 
-    def get_source_code(self, address: str) -> Tuple[str, bool]:
+    async def get_source_code(self, address: str) -> Tuple[str, bool, bool]:
         # v2 uniquement (le wrapper etherscan-python est V1).
-        return self._fetch_source_v2(address)
+        return await self._cached_fetch(address)
+
+    async def _get_impl_slot(self, address: str) -> Optional[str]:
+        """Lit le slot EIP-1967 via eth_getStorageAt (module proxy d'Etherscan).
+
+        Appel bien plus léger qu'un getsourcecode complet : sert à détecter un
+        changement d'implémentation sans re-télécharger la source.
+        """
+        params = {
+            "module": "proxy",
+            "action": "eth_getStorageAt",
+            "address": address,
+            "position": self.EIP1967_IMPL_SLOT,
+            "tag": "latest",
+            "chainid": self.chain_id,
+            "apikey": self.api_key,
+        }
+        data = await self._http_get(params)
+        if not data:
+            return None
+        result = data.get("result")
+        if isinstance(result, str) and result.startswith("0x"):
+            return result.lower()
+        return None
+
+    async def _proxy_cache_stale(self, address: str, cached_slot: Optional[str]) -> bool:
+        """True si l'implémentation du proxy a changé depuis la mise en cache."""
+        if not cached_slot:
+            return False  # pas de valeur de référence → on fait confiance au TTL
+        current = await self._get_impl_slot(address)
+        return bool(current) and current != cached_slot
+
+    async def _cached_fetch(self, address: str) -> Tuple[str, bool, bool]:
+        """Cache-aside autour de `_fetch_source_v2` (repeat analyses = 0 réseau).
+
+        Les entrées proxy sont revalidées à bas coût via le slot EIP-1967 :
+        seule une implémentation qui a bougé déclenche un re-fetch complet.
+        """
+        key = (self.chain_id, address.lower())
+        if HDP_CACHE_TTL > 0:
+            hit = _source_cache.get(key)
+            if hit is not None:
+                source, ok, was_proxy, slot = hit
+                if not (was_proxy and await self._proxy_cache_stale(address, slot)):
+                    if HDP_DEBUG:
+                        print(f"[HDP] source cache hit for {key}")
+                    return source, ok, was_proxy
+
+        # Deuxième niveau: Redis partagé entre workers/restarts
+        rkey = f"hdp:src:{self.chain_id}:{address.lower()}"
+        entry = await _redis_get(rkey)
+        if entry is not None:
+            source, was_proxy = entry.get("src", ""), bool(entry.get("proxy"))
+            slot = entry.get("slot")
+            if not (was_proxy and await self._proxy_cache_stale(address, slot)):
+                if HDP_CACHE_TTL > 0:
+                    _source_cache.set(key, (source, True, was_proxy, slot))
+                return source, True, was_proxy
 
-    def analyze_contract(self, address: str) -> Dict[str, object]:
+        source, ok, proxy_followed = await self._fetch_source_v2(address)
+        # On ne met pas en cache les échecs (souvent transitoires: quota, réseau)
+        if ok:
+            slot = await self._get_impl_slot(address) if proxy_followed else None
+            if HDP_CACHE_TTL > 0:
+                _source_cache.set(key, (source, ok, proxy_followed, slot))
+            # Avec un slot de référence on peut garder un TTL long même pour
+            # un proxy; sans slot, TTL court pour rattraper les upgrades
+            ttl = _REDIS_TTL if (not proxy_followed or slot) else _REDIS_TTL_PROXY
+            await _redis_set(rkey, {"src": source, "proxy": proxy_followed, "slot": slot}, ttl)
+        return source, ok, proxy_followed
+
+    async def analyze_contract(self, address: str) -> report.Report:
         self._validate_address(address)
-        source_code, source_available = self.get_source_code(address)
+        source_code, source_available, proxy_followed = await self.get_source_code(address)
+
+        # Tronque les sources énormes : les règles sont lexicales, tout signal
+        # utile apparaît largement avant la limite
+        if source_code and HDP_MAX_SOURCE_BYTES > 0:
+            source_code = source_code[:HDP_MAX_SOURCE_BYTES]
 
-        flags = rules.run_all_checks(source_code or "", source_available)
-        if self._last_proxy:
+        flags = await self._cached_flags(source_code or "", source_available)
+        if proxy_followed:
             flags["proxy_pattern"] = True
-        self._last_proxy = False
 
         return report.build_report(address=address, flags=flags)
+
+    async def _cached_flags(self, source_code: str, source_available: bool) -> Dict[str, bool]:
+        """run_all_checks mémoïsé par hash de la source (local + Redis)."""
+        if HDP_CACHE_TTL <= 0:
+            return await _run_rules(source_code, source_available)
+
+        key = _flags_cache_key(source_code, source_available)
+        hit = _flags_cache.get(key)
+        if hit is None:
+            hit = await _redis_get(key)
+            if hit is not None:
+                _flags_cache.set(key, hit)
+        if hit is not None:
+            return dict(hit)  # copie : le caller peut surcharger proxy_pattern
+
+        flags = await _run_rules(source_code, source_available)
+        _flags_cache.set(key, dict(flags))
+        await _redis_set(key, flags, _REDIS_TTL)
+        return flags
+
+    async def analyze_many(self, addresses: list[str]) -> list[report.Report]:
+        """Analyse un lot d'adresses en parallèle (asyncio.gather).
+
+        N adresses prennent ~le temps du fetch le plus lent au lieu de la
+        somme; la concurrence est bornée par HDP_MAX_INFLIGHT et le rate
+        limiter par chaîne s'applique toujours en dessous.
+        """
+        sem = asyncio.Semaphore(HDP_MAX_INFLIGHT)
+
+        async def _one(addr: str) -> report.Report:
+            async with sem:
+                return await self.analyze_contract(addr)
+
+        return list(await asyncio.gather(*(_one(a) for a in addresses)))
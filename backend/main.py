@@ -22,11 +22,13 @@
 from __future__ import annotations
 
 import sys
-import json
+import asyncio
 import argparse
 from typing import Any
 
+import orjson
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, constr
 from colorama import Fore, Style, init as color_init
 
@@ -37,6 +39,7 @@ try:
 except Exception:
     pass
 
+from backend import analyzer as analyzer_module
 from backend.analyzer import ContractAnalyzer
 
 # ----------------------------- #
@@ -49,13 +52,43 @@ class AnalyzeRequest(BaseModel):
     chain: str | None = "ethereum"
 
 
+class AnalyzeBatchRequest(BaseModel):
+    addresses: list[constr(strip_whitespace=True)]
+    chain: str | None = "ethereum"
+
+
 app = FastAPI(
     title="Honeypot Detector Pro",
     description="Analyse des contrats ERC-20 pour détecter les honeypots et risques.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
+@app.on_event("startup")
+async def _open_http_session() -> None:
+    """Pré-crée le client HTTP partagé + un analyzer par chaîne."""
+    await analyzer_module.get_session()
+    # Un ContractAnalyzer par chaîne, réutilisé entre requêtes : évite de
+    # relire les variables d'env et de reconstruire l'objet à chaque appel
+    app.state.analyzers = {
+        chain: ContractAnalyzer(chain=chain) for chain in ContractAnalyzer.CHAIN_IDS
+    }
+
+
+def _get_analyzer(chain: str) -> ContractAnalyzer:
+    analyzers = getattr(app.state, "analyzers", None)
+    if analyzers is None:  # CLI / tests sans événement startup
+        return ContractAnalyzer(chain=chain)
+    # chaîne inconnue → même repli que le constructeur (ethereum)
+    return analyzers.get(chain) or analyzers["ethereum"]
+
+
+@app.on_event("shutdown")
+async def _close_http_session() -> None:
+    await analyzer_module.close_session()
+
+
 @app.post("/analyze")
 async def analyze(request: AnalyzeRequest) -> Any:
     """Analyse une adresse de contrat et renvoie un rapport structuré."""
@@ -63,8 +96,8 @@ async def analyze(request: AnalyzeRequest) -> Any:
     chain = (request.chain or "ethereum").lower()
 
     try:
-        analyzer = ContractAnalyzer(chain=chain)
-        report_data = analyzer.analyze_contract(address)
+        analyzer = _get_analyzer(chain)
+        report_data = await analyzer.analyze_contract(address)
     except ValueError as ve:
         # invalid address / unsupported chain, etc.
         raise HTTPException(status_code=400, detail=str(ve))
@@ -73,30 +106,44 @@ async def analyze(request: AnalyzeRequest) -> Any:
     return report_data
 
 
+@app.post("/analyze_batch")
+async def analyze_batch(request: AnalyzeBatchRequest) -> Any:
+    """Analyse un lot d'adresses en parallèle (concurrence bornée)."""
+    chain = (request.chain or "ethereum").lower()
+
+    try:
+        analyzer = _get_analyzer(chain)
+        reports = await analyzer.analyze_many(request.addresses)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Erreur interne: {exc}")
+    return reports
+
+
 # ----------------------------- #
 #     CLI Mode
 # ----------------------------- #
 
 
-def _cli_print_report(report_data: dict) -> None:
+def _cli_print_report(report_data: "analyzer_module.report.Report") -> None:
     """Affiche joliment le rapport dans le terminal (avec couleurs)."""
     color_init(autoreset=True)
     risk_color = {
         "SAFE": Fore.GREEN,
         "MEDIUM": Fore.YELLOW,
         "HIGH": Fore.RED,
-    }.get(report_data.get("risk", ""), Fore.WHITE)
+    }.get(report_data.risk, Fore.WHITE)
 
-    print(f"\nContract: {report_data.get('address')}")
-    print(f"Score: {report_data.get('score')}/10")
-    print(f"Risk: {risk_color}{report_data.get('risk')}{Style.RESET_ALL}")
+    print(f"\nContract: {report_data.address}")
+    print(f"Score: {report_data.score}/10")
+    print(f"Risk: {risk_color}{report_data.risk}{Style.RESET_ALL}")
 
-    flags = report_data.get("flags") or []
-    if flags:
+    if report_data.flags:
         print("Flags:")
-        for flag in flags:
+        for flag in report_data.flags:
             print(f"  - {flag}")
-    print(f"Summary: {report_data.get('summary')}\n")
+    print(f"Summary: {report_data.summary}\n")
 
 
 def cli() -> None:
@@ -114,9 +161,15 @@ def cli() -> None:
     parser.add_argument("--out", type=str, help="Sauvegarde le rapport en JSON")
     args = parser.parse_args()
 
+    async def _run() -> "analyzer_module.report.Report":
+        try:
+            analyzer = ContractAnalyzer(chain=args.chain)
+            return await analyzer.analyze_contract(args.address)
+        finally:
+            await analyzer_module.close_session()
+
     try:
-        analyzer = ContractAnalyzer(chain=args.chain)
-        report_data = analyzer.analyze_contract(args.address)
+        report_data = asyncio.run(_run())
     except Exception as exc:
         print(f"❌ Erreur: {exc}")
         sys.exit(1)
@@ -124,8 +177,8 @@ def cli() -> None:
     # Sauvegarde optionnelle
     if args.out:
         try:
-            with open(args.out, "w", encoding="utf-8") as f:
-                json.dump(report_data, f, indent=2)
+            with open(args.out, "wb") as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
             print(f" Rapport sauvegardé dans {args.out}")
         except Exception as exc:
             print(f"⚠️  Erreur lors de la sauvegarde: {exc}")
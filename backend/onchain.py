@@ -0,0 +1,131 @@
+"""
+    onchain.py — Honeypot Detector Pro
+    Fine-grained on-chain reads batched through Multicall3.
+
+    Les futurs checks on-chain (balanceOf, allowance, simulation de
+    transfer/swap…) passeront par ici : N lectures sont agrégées en un seul
+    `eth_call` vers le contrat Multicall3, donc un seul aller-retour RPC au
+    lieu de N. Le contrat est déployé à la même adresse sur Ethereum, BSC et
+    Polygon.
+
+    Usage:
+        mc = Multicall3(analyzer)
+        results = await mc.execute([
+            Call(token, ERC20_BALANCE_OF + pad_address(holder)),
+            Call(token, ERC20_TOTAL_SUPPLY),
+        ])
+    """
+
+from __future__ import annotations
+
+from typing import List, NamedTuple, Optional, Tuple
+
+# Adresse canonique de Multicall3 (identique sur les 3 chaînes supportées).
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Sélecteur de aggregate3((address,bool,bytes)[]) — keccak256 figé.
+_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+# Sélecteurs ERC-20 usuels, prêts à concaténer avec leurs arguments encodés.
+ERC20_TOTAL_SUPPLY = bytes.fromhex("18160ddd")   # totalSupply()
+ERC20_BALANCE_OF = bytes.fromhex("70a08231")     # balanceOf(address)
+ERC20_ALLOWANCE = bytes.fromhex("dd62ed3e")      # allowance(address,address)
+
+
+class Call(NamedTuple):
+    """Un appel à agréger : contrat cible + calldata ABI déjà encodée."""
+
+    target: str
+    calldata: bytes
+    allow_failure: bool = True
+
+
+class Result(NamedTuple):
+    """Résultat d'un appel agrégé (success + returndata brute)."""
+
+    success: bool
+    data: bytes
+
+
+def pad_address(address: str) -> bytes:
+    """Encode une adresse en mot ABI de 32 octets (pour les arguments)."""
+    return bytes.fromhex(address[2:].rjust(64, "0"))
+
+
+def _encode_aggregate3(calls: List[Call]) -> bytes:
+    """Encode `aggregate3(Call3[])` à la main (pas de dépendance web3).
+
+    Chaque Call3 est un tuple dynamique (address, bool, bytes) : la tête du
+    tableau contient les offsets vers les corps, chaque corps contient un
+    offset interne fixe (0x60) vers ses bytes.
+    """
+    heads: List[bytes] = []
+    bodies: List[bytes] = []
+    offset = 32 * len(calls)  # offsets relatifs au début des données du tableau
+    for call in calls:
+        target_word = pad_address(call.target)
+        flag_word = (1 if call.allow_failure else 0).to_bytes(32, "big")
+        data = call.calldata
+        padded = data + b"\x00" * (-len(data) % 32)
+        body = (
+            target_word
+            + flag_word
+            + (0x60).to_bytes(32, "big")        # offset des bytes dans le tuple
+            + len(data).to_bytes(32, "big")
+            + padded
+        )
+        heads.append(offset.to_bytes(32, "big"))
+        bodies.append(body)
+        offset += len(body)
+    array = len(calls).to_bytes(32, "big") + b"".join(heads) + b"".join(bodies)
+    # Argument unique dynamique → offset 0x20 puis le tableau.
+    return _AGGREGATE3_SELECTOR + (0x20).to_bytes(32, "big") + array
+
+
+def _decode_aggregate3(payload: bytes) -> List[Result]:
+    """Décode le retour `Result[]` de aggregate3 (success, returnData)."""
+    array_start = int.from_bytes(payload[0:32], "big")
+    count = int.from_bytes(payload[array_start:array_start + 32], "big")
+    data_start = array_start + 32
+    results: List[Result] = []
+    for i in range(count):
+        head = data_start + 32 * i
+        elem = data_start + int.from_bytes(payload[head:head + 32], "big")
+        success = payload[elem + 31] == 1
+        bytes_off = elem + int.from_bytes(payload[elem + 32:elem + 64], "big")
+        length = int.from_bytes(payload[bytes_off:bytes_off + 32], "big")
+        results.append(Result(success, payload[bytes_off + 32:bytes_off + 32 + length]))
+    return results
+
+
+class Multicall3:
+    """Wrapper fin autour du contrat Multicall3 via l'endpoint proxy Etherscan.
+
+    Réutilise le `_http_get` de l'analyzer (même rate-limiting, mêmes
+    retries) ; `execute` coûte donc un seul crédit API quel que soit le
+    nombre de sous-appels.
+    """
+
+    def __init__(self, analyzer) -> None:
+        self._analyzer = analyzer
+
+    async def execute(self, calls: List[Call]) -> Optional[List[Result]]:
+        """Agrège `calls` en un seul eth_call ; None si le RPC échoue."""
+        if not calls:
+            return []
+        params = {
+            "module": "proxy",
+            "action": "eth_call",
+            "to": MULTICALL3_ADDRESS,
+            "data": "0x" + _encode_aggregate3(calls).hex(),
+            "tag": "latest",
+            "chainid": self._analyzer.chain_id,
+            "apikey": self._analyzer.api_key,
+        }
+        data = await self._analyzer._http_get(params)
+        if not data:
+            return None
+        result = data.get("result")
+        if not isinstance(result, str) or not result.startswith("0x") or len(result) <= 2:
+            return None
+        return _decode_aggregate3(bytes.fromhex(result[2:]))
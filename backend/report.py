@@ -4,7 +4,10 @@
     """
 
 from __future__ import annotations
-from typing import Dict, Any
+import dataclasses
+import functools
+from array import array
+from typing import Any, Dict, List, Tuple
 
 # --- 1️⃣ Flag weight mapping (risk intensity) ---
 
@@ -25,10 +28,29 @@ FLAG_WEIGHTS = {
     "max_limits_strict": 1,
     "dynamic_fees_public": 1,
     "transfer_trap": 1,
+    "unverified_code": 1,
 }
 
 MAX_SCORE = 10
 
+# Ordre canonique des flags, poids décroissant (stable : à poids égal, ordre
+# de déclaration). Une seule traversée construit la liste affichée ET la clé
+# de mémoïsation du score, les risques majeurs en tête du rapport.
+_ORDERED_FLAGS = tuple(sorted(FLAG_WEIGHTS, key=FLAG_WEIGHTS.__getitem__, reverse=True))
+
+# Score et classe de risque pré-tabulés pour les 2^12 masques de flags
+# possibles (bit i = _ORDERED_FLAGS[i]) : le scoring devient deux indexations
+# au lieu d'une somme pondérée + comparaisons. ~4 Ko chacun, construits une
+# fois à l'import.
+_WEIGHT_BY_BIT = tuple(FLAG_WEIGHTS[f] for f in _ORDERED_FLAGS)
+_SCORE_LUT = array(
+    "b",
+    (
+        min(sum(w for i, w in enumerate(_WEIGHT_BY_BIT) if mask >> i & 1), MAX_SCORE)
+        for mask in range(1 << len(_ORDERED_FLAGS))
+    ),
+)
+
 # --- 2️⃣ Risk level helper ---
 
 def classify_risk(score: int) -> str:
@@ -40,6 +62,10 @@ def classify_risk(score: int) -> str:
         return "HIGH"
 
 
+# Classe de risque par masque (mêmes 3 chaînes internées partagées).
+_RISK_LUT = tuple(classify_risk(s) for s in _SCORE_LUT)
+
+
 # --- 3️⃣ Human-readable summary builder ---
 
 def build_summary(flags: Dict[str, bool]) -> str:
@@ -76,20 +102,58 @@ def build_summary(flags: Dict[str, bool]) -> str:
 
 # --- 4️⃣ Main builder ---
 
-def build_report(address: str, flags: Dict[str, bool]) -> Dict[str, Any]:
-    score = 0
-    for flag, enabled in flags.items():
-        if enabled:
-            score += FLAG_WEIGHTS.get(flag, 1)
-
-    score = min(score, MAX_SCORE)
-    risk = classify_risk(score)
-    summary = build_summary(flags)
-
-    return {
-        "address": address,
-        "score": score,
-        "risk": risk,
-        "flags": [k for k, v in flags.items() if v],
-        "summary": summary,
-    }
+@functools.lru_cache(maxsize=512)
+def _summary_for(active: Tuple[str, ...]) -> str:
+    """Résumé pour un ensemble de flags actifs (mémoïsé).
+
+    Les contrats se concentrent sur quelques combinaisons : re-scorer un lot
+    revient vite à des lookups purs.
+    """
+    return build_summary(dict.fromkeys(active, True))
+
+
+def flags_to_mask(flags: Dict[str, bool]) -> int:
+    """Encode le dict de flags en masque uint16 (bit i = _ORDERED_FLAGS[i])."""
+    mask = 0
+    for bit, flag in enumerate(_ORDERED_FLAGS):
+        if flags.get(flag):
+            mask |= 1 << bit
+    return mask
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Report:
+    """Rapport d'analyse : slots figés plutôt qu'un dict (~3x moins de mémoire,
+    accès attribut sans hachage). orjson le sérialise nativement; l'accès
+    style dict est conservé pour les appelants existants."""
+
+    address: str
+    score: int
+    risk: str
+    flags: List[str]
+    summary: str
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+def build_report(address: str, flags: Dict[str, bool]) -> Report:
+    # Une seule traversée produit le masque (→ LUT score/risque) et la liste
+    # ordonnée affichée.
+    mask = 0
+    active = []
+    for bit, flag in enumerate(_ORDERED_FLAGS):
+        if flags.get(flag):
+            mask |= 1 << bit
+            active.append(flag)
+
+    return Report(
+        address=address,
+        score=_SCORE_LUT[mask],
+        risk=_RISK_LUT[mask],
+        flags=active,
+        summary=_summary_for(tuple(active)),
+    )
@@ -7,19 +7,194 @@
       - Présence d’owner/onlyOwner => contrôle possible
       - Si renounceOwnership() ou transferOwnership(address(0)) détectés => on NE
         déclenche PAS le flag owner_not_renounced
+
+    Perf : tous les mots-clés littéraux sont compilés dans un automate
+    Aho-Corasick (pyahocorasick) parcouru en UNE passe linéaire sur la source,
+    au lieu d'une recherche de sous-chaîne par pattern et par règle. Si la
+    dépendance manque, on retombe sur les scans par règle.
 """
 
 from __future__ import annotations
+import concurrent.futures
+import functools
+import hashlib
+import itertools
 import re
-from typing import Dict
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+# À incrémenter à chaque changement de règle : invalide les caches de flags
+# calculés (les règles sont des fonctions pures de la source).
+RULES_VERSION = 3
+
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None
+
+# Optional: moteur regex google-re2 (DFA temps linéaire, pas de backtracking).
+# Les constructions bornées type [^;]{0,80} restent O(N) même sur une source
+# adversariale, et le scan est natif plutôt que piloté par l'interpréteur.
+try:
+    import re2 as _re2  # type: ignore
+except Exception:
+    _re2 = None
+
+# Optional: Hyperscan (DFA multi-pattern vectorisé SSE/AVX2). Toutes les
+# règles regex passent alors en UNE passe native sur le buffer, au lieu d'un
+# finditer Python par alternation.
+try:
+    import hyperscan as _hyperscan  # type: ignore
+except Exception:
+    _hyperscan = None
+
+
+def _compile(pattern: str, ignorecase: bool = False):
+    """Compile avec re2 si disponible, sinon retombe sur re (API identique)."""
+    if _re2 is not None:
+        try:
+            return _re2.compile(("(?i)" + pattern) if ignorecase else pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, re.IGNORECASE if ignorecase else 0)
 
 
 # ------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------
+# Table de suppression des blancs pour str.translate : une passe C unique,
+# sans moteur regex ni chaîne de .replace() intermédiaires.
+_WS_DELETE = str.maketrans("", "", " \t\n\r\v\f")
+
+# Table fusionnée pour _normalize : minuscule ASCII + suppression des blancs
+# dans la MÊME passe — 1 allocation au lieu de 2 (les mots-clés sont ASCII,
+# la casse Unicode exotique n'a pas d'importance ici).
+_NORM_TABLE = {
+    **{ord(ch): None for ch in " \t\n\r\v\f"},
+    **{c: c + 32 for c in range(ord("A"), ord("Z") + 1)},
+}
+
+
 def _normalize(code: str) -> str:
     """Minifie et normalise la casse + espaces pour les recherches rapides."""
-    return code.lower().replace(" ", "").replace("\n", "")
+    return code.translate(_NORM_TABLE)
+
+
+# Commentaires (// et /* */) et littéraux de chaîne Solidity : retirés avant
+# le scan. Un NatSpec qui documente une "blacklist" ne doit pas lever le flag,
+# et une source flattenée est typiquement 20-40 % de commentaires — autant de
+# moins à parcourir pour l'automate.
+_STRIP_RE = _compile(r'(?s)//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\])*"')
+
+
+def _strip_noise(code: str) -> str:
+    """Supprime commentaires et littéraux de chaîne en une passe."""
+    return _STRIP_RE.sub("", code)
+
+
+# ------------------------------------------------------------
+# Literal keyword sets (matched on the lowercased source)
+# ------------------------------------------------------------
+_FEE_PATTERNS = ("settax", "setfee", "setfees", "updatetax", "buyfee", "sellfee", "changetax")
+_BLACKLIST_PATTERNS = ("blacklist", "whitelist", "blocklist", "banuser", "setmaxtx", "maxwallet", "removeliquidity")
+_MINT_PATTERNS = ("_mint(", "function mint")
+_PAUSE_PATTERNS = (
+    "whennotpaused", "whenpaused", "paused()", "pausable",
+    "pausetrading", "settrading", "enabletrading", "tradingopen", "opentrading",
+)
+_LIMIT_PATTERNS = ("setmaxtx", "maxtx", "maxwallet", "maxwalletsize", "maxsell", "maxbuy", "maxtransactionamount", "maxtransaction")
+_FEE_SETTER_PATTERNS = ("setfee", "setfees", "settax", "updatetax")
+
+# Literal keyword sets matched on the compact form (whitespace stripped)
+_PROXY_PATTERNS = ("delegatecall(", "eip1967", "implementation", "proxy")
+_TRAP_PATTERNS = (
+    "require(from!=owner", "require(_from!=owner",
+    "require(to!=owner", "require(_to!=owner",
+    "require(from==owner", "require(_from==owner",
+    "require(to==owner", "require(_to==owner",
+)
+_UNISWAP_QUICK_PATTERNS = ("require(to!=uniswap", "to!=uniswappair", "to!=uniswapv2pair")
+
+# flag → patterns, par buffer de recherche
+_LOWER_FLAG_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "modifiable_fee": _FEE_PATTERNS,
+    "blacklist_whitelist": _BLACKLIST_PATTERNS,
+    "minting": _MINT_PATTERNS,
+    "pause_trading": _PAUSE_PATTERNS,
+    "transfer_limits": _LIMIT_PATTERNS,
+}
+_COMPACT_FLAG_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "proxy_pattern": _PROXY_PATTERNS,
+    "transfer_trap": _TRAP_PATTERNS,
+    "uniswap_restriction": _UNISWAP_QUICK_PATTERNS,
+}
+
+
+def _invert(flag_patterns: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    """Inverse flag→patterns en keyword→flags (construit une fois à l'import).
+
+    Un même mot-clé peut contribuer à plusieurs règles (setmaxtx, setfee…) :
+    la table dédoublonne ces partages, donc chaque sous-chaîne n'est cherchée
+    qu'une fois quel que soit le nombre de règles qui l'utilisent.
+    """
+    by_keyword: Dict[str, Tuple[str, ...]] = {}
+    for flag, patterns in flag_patterns.items():
+        for kw in patterns:
+            by_keyword[kw] = by_keyword.get(kw, ()) + (flag,)
+    return by_keyword
+
+
+_KEYWORD_TABLE_LOWER = _invert(_LOWER_FLAG_PATTERNS)
+_KEYWORD_TABLE_COMPACT = _invert(_COMPACT_FLAG_PATTERNS)
+
+
+def _build_automaton(keyword_table: Dict[str, Tuple[str, ...]]):
+    """Compile une table keyword→flags en automate Aho-Corasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, flags in keyword_table.items():
+        automaton.add_word(kw, flags)
+    automaton.make_automaton()
+    return automaton
+
+
+_AC_LOWER = _build_automaton(_KEYWORD_TABLE_LOWER)
+_AC_COMPACT = _build_automaton(_KEYWORD_TABLE_COMPACT)
+
+# Flags atteignables par chaque automate : sert au court-circuit ci-dessous.
+_LOWER_LITERAL_FLAGS = frozenset(_LOWER_FLAG_PATTERNS)
+_COMPACT_LITERAL_FLAGS = frozenset(_COMPACT_FLAG_PATTERNS)
+
+
+def _iter_saturating(automaton, buf: str, reachable: frozenset, hits: Set[str]) -> None:
+    """Parcourt l'automate et s'arrête dès que tous ses flags sont levés.
+
+    Les honeypots évidents saturent leurs flags dans les premiers Ko : on
+    scanne alors un préfixe au lieu de la source entière.
+    """
+    remaining = set(reachable)
+    for _, flags in automaton.iter(buf):
+        hits.update(flags)
+        remaining.difference_update(flags)
+        if not remaining:
+            break
+
+
+def _scan_literals(lower: str, compact: str) -> Set[str]:
+    """Une passe Aho-Corasick par buffer → ensemble des flags littéraux touchés."""
+    hits: Set[str] = set()
+    if _AC_LOWER is not None and _AC_COMPACT is not None:
+        _iter_saturating(_AC_LOWER, lower, _LOWER_LITERAL_FLAGS, hits)
+        _iter_saturating(_AC_COMPACT, compact, _COMPACT_LITERAL_FLAGS, hits)
+    else:
+        # Fallback sans pyahocorasick : un scan par mot-clé dédoublonné
+        for kw, flags in _KEYWORD_TABLE_LOWER.items():
+            if kw in lower:
+                hits.update(flags)
+        for kw, flags in _KEYWORD_TABLE_COMPACT.items():
+            if kw in compact:
+                hits.update(flags)
+    return hits
 
 
 # ------------------------------------------------------------
@@ -27,62 +202,166 @@ def _normalize(code: str) -> str:
 # ------------------------------------------------------------
 def check_modifiable_fee(code: str) -> bool:
     s = code.lower()
-    patterns = ["settax", "setfee", "setfees", "updatetax", "buyfee", "sellfee", "changetax"]
-    return any(p in s for p in patterns)
+    return any(p in s for p in _FEE_PATTERNS)
 
 
 def check_blacklist_whitelist(code: str) -> bool:
     s = code.lower()
-    patterns = ["blacklist", "whitelist", "blocklist", "banuser", "setmaxtx", "maxwallet", "removeliquidity"]
-    return any(p in s for p in patterns)
+    return any(p in s for p in _BLACKLIST_PATTERNS)
+
+
+# Alternation unique regroupant les trois règles regex : une seule traversée
+# du buffer produit tous les hits au lieu d'un finditer/search par règle.
+_COMBINED_RE = _compile(
+    r"(?P<max_pct>max\w*percent\s*=\s*(?P<max_val>\d{1,2}))"
+    r"|(?P<pub_fee>\b(?:u?int(?:256)?)\s+public\s+\w*(?:fee|tax)\w*)"
+    # RHS "contient pair" fusionné dans le motif : plus de test Python par match
+    r"|(?P<uniswap>require\s*\(\s*_?to\s*!=\s*(?:pair|[a-z_]\w*pair)\w*\s*[,)])"
+)
+# Clause résiduelle de max_limits_strict (affectation différée dans les 80 chars)
+_MAX_PERCENT_EQ12_RE = _compile(r"(max\w*percent)[^;]{0,80}=\s*[12]\b")
+
+# Extraction de la valeur max*percent, pour confirmer un hit Hyperscan
+# (Hyperscan ne capture pas de groupes, la comparaison <= 2 reste en Python).
+_MAX_PCT_VAL_RE = _compile(r"max\w*percent\s*=\s*(\d{1,2})")
+
+# Base Hyperscan : id 1/2 sont des traductions exactes des branches de
+# _COMBINED_RE ; id 0 est un préfiltre large (toute affectation numérique)
+# confirmé ensuite par _MAX_PCT_VAL_RE pour garder la sémantique <= 2.
+_HS_EXPRESSIONS = (
+    rb"max\w*percent\s*=\s*\d",
+    rb"\bu?int(?:256)?\s+public\s+\w*(?:fee|tax)\w*",
+    rb"require\s*\(\s*_?to\s*!=\s*(?:pair|[a-z_]\w*pair)\w*\s*[,)]",
+)
+
+
+def _build_hs_db():
+    if _hyperscan is None:
+        return None
+    try:
+        db = _hyperscan.Database()
+        db.compile(
+            expressions=list(_HS_EXPRESSIONS),
+            ids=list(range(len(_HS_EXPRESSIONS))),
+            elements=len(_HS_EXPRESSIONS),
+            flags=[_hyperscan.HS_FLAG_SINGLEMATCH] * len(_HS_EXPRESSIONS),
+        )
+        return db
+    except Exception:
+        return None
+
+
+_HS_DB = _build_hs_db()
+
+
+def _confirm_max_pct(lower: str) -> bool:
+    for m in _MAX_PCT_VAL_RE.finditer(lower):
+        try:
+            if int(m.group(1)) <= 2:
+                return True
+        except Exception:
+            pass
+    return False
 
 
-_UNISWAP_PAIR_RE = re.compile(r"require\s*\(\s*(?:_?to)\s*!=\s*([a-zA-Z_]\w*)\s*[,)]", re.IGNORECASE)
+def _scan_combined_hs(lower: str) -> set:
+    """Chemin Hyperscan : une passe vectorisée, ids → flags."""
+    ids: set = set()
+    _HS_DB.scan(lower.encode("utf-8", "ignore"),
+                match_event_handler=lambda i, f, t, fl, ctx: ids.add(i))
+    hits = set()
+    if 0 in ids and _confirm_max_pct(lower):
+        hits.add("max_limits_strict")
+    if 1 in ids:
+        hits.add("has_public_fee")
+    if 2 in ids:
+        hits.add("uniswap_restriction")
+    return hits
+
+
+def _scan_combined(lower: str) -> set:
+    """Une passe regex → hits {'max_limits_strict', 'has_public_fee',
+    'uniswap_restriction'} (Hyperscan si dispo, sinon _COMBINED_RE)."""
+    if _HS_DB is not None:
+        return _scan_combined_hs(lower)
+    # Pré-filtre à mots-clés (deux phases façon SolidityCheck) : chaque branche
+    # de l'alternation exige un littéral bon marché — si aucun n'apparaît, la
+    # passe regex est inutile.
+    if "percent" not in lower and "public" not in lower and "require" not in lower:
+        return set()
+    hits = set()
+    for m in _COMBINED_RE.finditer(lower):
+        if m.group("max_pct") is not None:
+            try:
+                if int(m.group("max_val")) <= 2:
+                    hits.add("max_limits_strict")
+            except Exception:
+                pass
+        elif m.group("pub_fee") is not None:
+            hits.add("has_public_fee")
+        else:
+            hits.add("uniswap_restriction")
+    return hits
+
+
+def _max_limits_residual(lower: str) -> bool:
+    return ("maxwalletpercent" in lower or "maxtxpercent" in lower) and bool(_MAX_PERCENT_EQ12_RE.search(lower))
 
 
 def check_uniswap_restriction(code: str) -> bool:
     compact = _normalize(code)
-    if any(q in compact for q in ["require(to!=uniswap", "to!=uniswappair", "to!=uniswapv2pair"]):
+    if any(q in compact for q in _UNISWAP_QUICK_PATTERNS):
         return True
-    for m in _UNISWAP_PAIR_RE.finditer(code):
-        if "pair" in m.group(1).lower():
-            return True
-    return False
+    return "uniswap_restriction" in _scan_combined(code.lower())
 
 
 def check_minting(code: str) -> bool:
     s = code.lower()
-    return "_mint(" in s or "function mint" in s
+    return any(p in s for p in _MINT_PATTERNS)
 
 
 def check_pause_trading(code: str) -> bool:
     s = code.lower()
-    pausable = ["whennotpaused", "whenpaused", "paused()", "pausable"]
-    trading = ["pausetrading", "settrading", "enabletrading", "tradingopen", "opentrading"]
-    return any(p in s for p in pausable + trading)
+    return any(p in s for p in _PAUSE_PATTERNS)
 
 
 def check_proxy_pattern(code: str) -> bool:
     compact = _normalize(code)
-    return any(p in compact for p in ["delegatecall(", "eip1967", "implementation", "proxy"])
+    return any(p in compact for p in _PROXY_PATTERNS)
 
 
 def check_transfer_limits(code: str) -> bool:
     s = code.lower()
-    patterns = ["setmaxtx", "maxtx", "maxwallet", "maxwalletsize", "maxsell", "maxbuy", "maxtransactionamount", "maxtransaction"]
-    return any(p in s for p in patterns)
+    return any(p in s for p in _LIMIT_PATTERNS)
 
 
 def check_unverified_code(source_code: str) -> bool:
-    return not source_code or len(source_code.strip()) == 0
+    # isspace() scanne en C sans copier, contrairement à len(s.strip()) == 0
+    return not source_code or source_code.isspace()
 
 
 # ------------------------------------------------------------
 # Owner / renounce detection
 # ------------------------------------------------------------
-OWNABLE_RE = re.compile(r"\b(?:onlyOwner|owner\s*\()", re.IGNORECASE)
-RENOUNCE_RE = re.compile(r"\brenounceOwnership\s*\(", re.IGNORECASE)
-ZERO_OWNER_SET_RE = re.compile(r"transferOwnership\s*\(\s*address\s*\(\s*0\s*\)\s*\)", re.IGNORECASE)
+OWNABLE_RE = _compile(r"\b(?:onlyOwner|owner\s*\()", ignorecase=True)
+
+# Indices de renonciation : sur le buffer compact ce sont de purs littéraux,
+# le substring C (memmem vectorisé) remplace deux regex.
+_RENOUNCE_LITERALS = ("renounceownership(", "transferownership(address(0))")
+
+
+def _check_owner_not_renounced(lower: str, compact: str) -> bool:
+    # Pré-filtre littéral : tout ce qui suit exige "owner", un substring C
+    # évite la regex sur les contrats qui n'en ont pas.
+    if "owner" not in lower:
+        return False
+    # OWNABLE_RE garde son \b (un littéral matcherait "tokenOwner(")
+    if not OWNABLE_RE.search(lower):
+        return False
+    # Si on voit une renonciation explicite, on ne trigger pas le flag
+    if any(p in compact for p in _RENOUNCE_LITERALS):
+        return False
+    return True
 
 
 def check_owner_not_renounced(code: str, source_available: bool) -> bool:
@@ -92,72 +371,141 @@ def check_owner_not_renounced(code: str, source_available: bool) -> bool:
     """
     if not source_available:
         return False
-    s = code
-    has_owner_controls = bool(OWNABLE_RE.search(s))
-    if not has_owner_controls:
-        return False
-    # Si on voit une renonciation explicite, on ne trigger pas le flag
-    if RENOUNCE_RE.search(s) or ZERO_OWNER_SET_RE.search(s):
-        return False
-    return True
+    lower = code.lower()
+    return _check_owner_not_renounced(lower, lower.translate(_WS_DELETE))
 
 
 # ------------------------------------------------------------
 # B1.2 extended rules
 # ------------------------------------------------------------
 def check_max_limits_strict(code: str) -> bool:
-    s = code.lower()
-    for m in re.finditer(r"max\w*percent\s*=\s*(\d{1,2})", s):
-        try:
-            if int(m.group(1)) <= 2:
-                return True
-        except Exception:
-            pass
-    if ("maxwalletpercent" in s or "maxtxpercent" in s) and re.search(r"(max\w*percent)[^;]{0,80}=\s*[12]\b", s):
-        return True
-    return False
+    lower = code.lower()
+    return "max_limits_strict" in _scan_combined(lower) or _max_limits_residual(lower)
 
 
 def check_dynamic_fees_public(code: str) -> bool:
-    s = code.lower()
-    has_public_fee = bool(re.search(r"\b(?:u?int(?:256)?)\s+public\s+\w*(?:fee|tax)\w*", s))
-    has_setter = any(k in s for k in ("setfee", "setfees", "settax", "updatetax"))
-    return has_public_fee and has_setter
+    lower = code.lower()
+    has_setter = any(k in lower for k in _FEE_SETTER_PATTERNS)
+    return has_setter and "has_public_fee" in _scan_combined(lower)
 
 
 def check_transfer_trap(code: str) -> bool:
     compact = _normalize(code)
-    patterns = [
-        "require(from!=owner", "require(_from!=owner",
-        "require(to!=owner", "require(_to!=owner",
-        "require(from==owner", "require(_from==owner",
-        "require(to==owner", "require(_to==owner",
-    ]
-    return any(p in compact for p in patterns)
+    return any(p in compact for p in _TRAP_PATTERNS)
 
 
 # ------------------------------------------------------------
 # Main dispatcher
 # ------------------------------------------------------------
-def run_all_checks(code: str, source_available: bool) -> Dict[str, bool]:
-    """Run all heuristic checks and return boolean flags."""
-    flags = {
-        "modifiable_fee": check_modifiable_fee(code) if source_available else False,
-        "blacklist_whitelist": check_blacklist_whitelist(code) if source_available else False,
-        "uniswap_restriction": check_uniswap_restriction(code) if source_available else False,
-
-        # ✅ vraie détection (plus de hotfix forcé)
-        "owner_not_renounced": check_owner_not_renounced(code, source_available),
-
-        "minting": check_minting(code) if source_available else False,
-        "pause_trading": check_pause_trading(code) if source_available else False,
-        "unverified_code": check_unverified_code(code) if not source_available else False,
-        "transfer_limits": check_transfer_limits(code) if source_available else False,
-        "proxy_pattern": check_proxy_pattern(code) if source_available else False,
-
-        # Extended B1.2
-        "max_limits_strict": check_max_limits_strict(code) if source_available else False,
-        "dynamic_fees_public": check_dynamic_fees_public(code) if source_available else False,
-        "transfer_trap": check_transfer_trap(code) if source_available else False,
-    }
+# Table de dispatch figée au chargement : (flag, resolver, needs_source).
+# Chaque resolver reçoit (code, lower, hits). needs_source=True → la règle ne
+# s'évalue que sur source vérifiée; False → uniquement sans source (cas
+# unverified_code). Ajouter une règle = ajouter une ligne, plus de
+# special-casing dans la boucle.
+_RULES = (
+    ("modifiable_fee", lambda code, lower, hits: "modifiable_fee" in hits, True),
+    ("blacklist_whitelist", lambda code, lower, hits: "blacklist_whitelist" in hits, True),
+    ("uniswap_restriction", lambda code, lower, hits: "uniswap_restriction" in hits, True),
+    # ✅ vraie détection (plus de hotfix forcé) — évaluée avec les scans, où
+    # le buffer compact est disponible
+    ("owner_not_renounced", lambda code, lower, hits: "owner_not_renounced" in hits, True),
+    ("minting", lambda code, lower, hits: "minting" in hits, True),
+    ("pause_trading", lambda code, lower, hits: "pause_trading" in hits, True),
+    ("unverified_code", lambda code, lower, hits: check_unverified_code(code), False),
+    ("transfer_limits", lambda code, lower, hits: "transfer_limits" in hits, True),
+    ("proxy_pattern", lambda code, lower, hits: "proxy_pattern" in hits, True),
+    # Extended B1.2
+    ("max_limits_strict", lambda code, lower, hits: "max_limits_strict" in hits or _max_limits_residual(lower), True),
+    ("dynamic_fees_public", lambda code, lower, hits: "has_public_fee" in hits and any(k in lower for k in _FEE_SETTER_PATTERNS), True),
+    ("transfer_trap", lambda code, lower, hits: "transfer_trap" in hits, True),
+)
+
+
+# Gabarit tout-False figé à l'import : chaque appel part d'une copie C de ce
+# dict (insertion + hachage des 12 clés payés une seule fois) et ne touche que
+# les règles effectivement déclenchées.
+_EMPTY_FLAGS = {flag: False for flag, _, _ in _RULES}
+
+
+def _compute_flags(code: str, source_available: bool) -> Dict[str, bool]:
+    """Évalue toutes les règles sur une source (chemin sans cache).
+
+    La source n'est normalisée qu'UNE fois (lower + compact) : l'automate et
+    toutes les règles regex travaillent sur ces deux buffers partagés au lieu
+    de recalculer .lower()/.replace() règle par règle.
+    """
+    if source_available:
+        lower = _strip_noise(code).lower()
+        compact = lower.translate(_WS_DELETE)
+        hits = _scan_literals(lower, compact)
+        hits |= _scan_combined(lower)
+        if _check_owner_not_renounced(lower, compact):
+            hits.add("owner_not_renounced")
+    else:
+        lower = ""
+        hits = set()
+
+    flags = dict(_EMPTY_FLAGS)
+    for flag, resolver, needs_source in _RULES:
+        if source_available == needs_source and resolver(code, lower, hits):
+            flags[flag] = True
     return flags
+
+
+# Mémoïsation process-locale : les règles sont des fonctions pures de la
+# source, donc re-analyser la même source (refresh dashboard, proxies
+# partageant une implémentation) ne doit coûter qu'un lookup. La clé est le
+# digest blake2b 16 octets — hasher 16 B par lookup plutôt que la source
+# entière. `_PENDING` porte la source jusqu'au calcul en cas de miss.
+_PENDING: Dict[Tuple[bytes, bool], str] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _memoized_flags(key: Tuple[bytes, bool]) -> Tuple[Tuple[str, bool], ...]:
+    return tuple(_compute_flags(_PENDING[key], key[1]).items())
+
+
+def run_all_checks(code: str, source_available: bool) -> Dict[str, bool]:
+    """Run all heuristic checks and return boolean flags (memoized)."""
+    digest = hashlib.blake2b(code.encode("utf-8", "ignore"), digest_size=16).digest()
+    key = (digest, source_available)
+    _PENDING[key] = code
+    try:
+        items = _memoized_flags(key)
+    finally:
+        _PENDING.pop(key, None)
+    # dict neuf à chaque appel : l'appelant peut le muter (ex. proxy_pattern)
+    # sans corrompre l'entrée mémoïsée.
+    return dict(items)
+
+
+# En dessous de ce nombre de sources, l'IPC du pool coûte plus cher que le
+# scan lui-même : on reste séquentiel.
+_BATCH_THRESHOLD = 32
+
+
+def run_all_checks_batch(
+    codes: Sequence[str],
+    source_available: bool = True,
+    workers: Optional[int] = None,
+) -> list:
+    """Évalue les règles sur un lot de sources, en parallèle si le lot est gros.
+
+    Le scan est trivialement parallèle par adresse : au-delà de
+    `_BATCH_THRESHOLD` sources, le travail est réparti sur un
+    ProcessPoolExecutor (chunksize 16 pour amortir l'IPC). Les workers
+    héritent des automates construits à l'import du module — rien à
+    resérialiser ni à reconstruire au démarrage sous fork.
+    """
+    codes = list(codes)
+    if len(codes) < _BATCH_THRESHOLD or (workers is not None and workers <= 1):
+        return [run_all_checks(code, source_available) for code in codes]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                run_all_checks,
+                codes,
+                itertools.repeat(source_available),
+                chunksize=16,
+            )
+        )
@@ -0,0 +1,20 @@
+# tests/conftest.py — fixtures partagées
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def fake_solidity_source() -> str:
+    """Source Solidity factice couvrant tous les patterns détectés.
+
+    Chargée une fois par session et internée : les tests partagent le même
+    objet str, et la mémoïsation de run_all_checks rend les appels suivants
+    gratuits.
+    """
+    return sys.intern((_FIXTURES / "honeypot.sol").read_text(encoding="utf-8"))
@@ -5,53 +5,8 @@ from backend import rules
 from backend.report import build_report
 
 
-def test_run_all_checks_with_source():
-    fake_code = """
-    // ===== Fees & taxes =====
-    uint256 public buyFee = 10;
-    function setFee(uint256 f) external onlyOwner { buyFee = f; }
-    function setFees(uint256 b, uint256 s) external onlyOwner {}
-
-    // ===== Black/white lists & limits =====
-    mapping(address => bool) blacklist;
-    function setMaxTx(uint256 v) external onlyOwner {}
-    uint256 maxTxPercent = 1;           // <= 2%
-    uint256 maxWalletPercent = 2;       // <= 2%
-
-    // ===== Owner control (Ownable + onlyOwner; no renounce) =====
-    contract X is Ownable {
-        modifier onlyOwner() { _; }
-        function owner() public view returns (address) { return address(0x123); }
-    }
-
-    // ===== Minting =====
-    function mint(address to, uint256 a) external onlyOwner {}
-    function _mint(address to, uint256 a) internal {}
-
-    // ===== Pause/Trading (OZ + toggles) =====
-    function pause() external onlyOwner {}
-    function unpause() external onlyOwner {}
-    function enableTrading() external onlyOwner {}
-    function openTrading() external onlyOwner {}
-    function _before() internal whenNotPaused {}
-    function _after() internal whenPaused {}
-
-    // ===== Uniswap restriction (generic pair var) =====
-    address public lpPair;
-    function _transfer(address from, address to, uint256 amount) internal {
-        require(to != lpPair, "blocked");
-        require(from != owner() && to != owner(), "trap");
-    }
-
-    // ===== Proxy / delegatecall =====
-    function _proxyForward(bytes memory data) internal returns (bytes memory) {
-        (bool ok, bytes memory res) = address(impl).delegatecall(data);
-        return res;
-    }
-    // No renounceOwnership present on purpose
-    """
-
-    flags = rules.run_all_checks(fake_code, source_available=True)
+def test_run_all_checks_with_source(fake_solidity_source):
+    flags = rules.run_all_checks(fake_solidity_source, source_available=True)
 
     # Existing checks
     assert flags["modifiable_fee"] is True